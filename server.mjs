@@ -10,6 +10,8 @@ import rateLimit from 'express-rate-limit';
 import { fetchPaper, getSourceHealth } from './src/paperFetcher.mjs';
 import { fetchFromUnpaywall } from './src/fetchers/unpaywall.mjs';
 import { fetchPaperWithProgress } from './src/paperFetcherStream.mjs';
+import { normalizeDoi } from './src/utils/doi.mjs';
+import { flushCache } from './src/cache.mjs';
 import logger, { createRequestLogger } from './src/logger.mjs';
 import { getMetrics, getPrometheusMetrics, recordCacheEvent, recordFetchRequest } from './src/metrics.mjs';
 
@@ -360,9 +362,9 @@ app.post('/api/fetch-by-doi', apiLimiter, async (req, res) => {
       });
     }
 
-    // Basic DOI format validation
+    // Basic DOI format validation (resolver URLs like https://doi.org/... are accepted)
     const doiPattern = /^10\.\d{4,}\/[^\s]+$/;
-    const cleanDoi = doi.trim();
+    const cleanDoi = normalizeDoi(doi);
     if (!doiPattern.test(cleanDoi)) {
       return res.status(400).json({
         success: false,
@@ -426,10 +428,10 @@ app.get('/api/fetch-stream', apiLimiter, async (req, res) => {
   const reqLog = createRequestLogger(req);
   reqLog.info({ title }, 'SSE fetch started');
 
-  // Helper to send SSE events
+  // Helper to send SSE events - one write per event so each is framed
+  // and flushed as a single chunk
   const emit = (event, data) => {
-    res.write(`event: ${event}\n`);
-    res.write(`data: ${JSON.stringify(data)}\n\n`);
+    res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
   };
 
   try {
@@ -451,9 +453,10 @@ app.get('/api/fetch-stream', apiLimiter, async (req, res) => {
  * Returns BibTeX citation string
  */
 app.get('/api/bibtex', apiLimiter, async (req, res) => {
-  const { doi } = req.query;
+  // Accept resolver URLs (https://doi.org/...) as well as bare DOIs
+  const doi = typeof req.query.doi === 'string' ? normalizeDoi(req.query.doi) : null;
 
-  if (!doi || typeof doi !== 'string') {
+  if (!doi) {
     return res.status(400).json({
       success: false,
       error: 'Missing or invalid "doi" query parameter'
@@ -536,4 +539,13 @@ async function startServer() {
 
 startServer();
 
+// Persist queued cache writes before exiting (SIGTERM also covers node --watch restarts)
+for (const signal of ['SIGTERM', 'SIGINT']) {
+  process.once(signal, async () => {
+    logger.info({ signal }, 'Shutting down, flushing cache');
+    await flushCache();
+    process.exit(0);
+  });
+}
+
 export default app;
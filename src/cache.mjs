@@ -10,6 +10,7 @@ const CACHE_FILE = process.env.CACHE_FILE || './cache.json';
 const CACHE_PREFIX = 'paper:';
 const NEGATIVE_CACHE_PREFIX = 'negative:';
 const CACHE_TTL = 60 * 60 * 24 * 30; // 30 days in seconds
+const WHITESPACE = /\s+/g;
 
 // Cache configuration
 const CACHE_CONFIG = {
@@ -17,11 +18,37 @@ const CACHE_CONFIG = {
   maxAgeNotFound: 1 * 24 * 60 * 60 * 1000,   // 1 day for "not found" results
   staleWhileRevalidate: 1 * 60 * 60 * 1000,  // 1 hour stale-while-revalidate window
   maxEntries: 10000,                          // Max entries for LRU eviction
+  writeFlushMs: 50,                           // Coalescing window for JSON file writes
+  memoryMaxEntries: 2048,                     // In-process L1 size in front of KV
+  memoryTtl: 5 * 60 * 1000,                   // 5 minutes before re-reading from KV
+  purgeInterval: 10 * 60 * 1000,              // Sweep expired JSON entries every 10 minutes
 };
 
 let kvClient = null;
 let useKV = false;
 
+// Counter for unique temp file names during atomic writes
+let writeSeq = 0;
+
+// Parsed JSON file cache, reused until the file changes on disk
+let fileCache = null;
+let fileCacheStamp = null;
+
+// Pending JSON file writes (normalized key -> entry, or null to delete)
+// Drained by a single flush per window so concurrent sets share one write
+let pendingWrites = new Map();
+// Every queued write not yet on disk, so reads see their own writes
+const unflushedWrites = new Map();
+let scheduledFlush = null;
+let resolveScheduledFlush = null;
+let flushTimer = null;
+let flushChain = Promise.resolve(true);
+let lastPurgeAt = 0;
+
+// In-process L1 in front of Vercel KV (full KV key -> { value, expiresAt })
+// Map insertion order doubles as LRU order
+const memoryCache = new Map();
+
 // Background revalidation queue
 const revalidationQueue = new Set();
 
@@ -52,7 +79,17 @@ async function initCache() {
  * Normalize title for cache key
  */
 export function normalizeTitle(title) {
-  return title.toLowerCase().trim().replace(/\s+/g, ' ');
+  return title.toLowerCase().trim().replace(WHITESPACE, ' ');
+}
+
+/**
+ * Resolve a caller-supplied key to its normalized cache key
+ * @param {string} key - Paper title, or a key already passed through normalizeTitle
+ * @param {{ normalized?: boolean }} [options] - normalized: key is already normalized
+ * @returns {string}
+ */
+function toCacheKey(key, { normalized = false } = {}) {
+  return normalized ? key : normalizeTitle(key);
 }
 
 /**
@@ -77,6 +114,187 @@ function checkStaleness(entry, isNegative = false) {
   return { expired, stale };
 }
 
+/**
+ * Look up a KV entry in the in-process L1
+ * @param {string} kvKey - Full KV key (including prefix)
+ * @returns {object|undefined} Cached value, or undefined on miss
+ */
+function memoryGet(kvKey) {
+  const hit = memoryCache.get(kvKey);
+  if (!hit) return undefined;
+
+  if (hit.expiresAt <= Date.now()) {
+    memoryCache.delete(kvKey);
+    return undefined;
+  }
+
+  // Refresh LRU position
+  memoryCache.delete(kvKey);
+  memoryCache.set(kvKey, hit);
+  return hit.value;
+}
+
+/**
+ * Store a KV entry in the in-process L1, evicting the least recently used
+ * @param {string} kvKey - Full KV key (including prefix)
+ * @param {object} value - Value as stored in KV
+ */
+function memorySet(kvKey, value) {
+  memoryCache.delete(kvKey);
+  memoryCache.set(kvKey, { value, expiresAt: Date.now() + CACHE_CONFIG.memoryTtl });
+
+  if (memoryCache.size > CACHE_CONFIG.memoryMaxEntries) {
+    memoryCache.delete(memoryCache.keys().next().value);
+  }
+}
+
+/**
+ * Identify a version of the cache file by mtime and size
+ */
+function fileStamp(stats) {
+  return `${stats.mtimeMs}:${stats.size}`;
+}
+
+/**
+ * Load the JSON file cache
+ * Only re-reads and parses the file when it changed since the last load,
+ * so lookups cost a stat instead of a full parse
+ * @returns {Promise<object>} Parsed cache (shared - do not mutate outside flushWrites)
+ * @throws If the file doesn't exist or isn't valid JSON
+ */
+async function loadCacheFile() {
+  const stamp = fileStamp(await fs.stat(CACHE_FILE));
+  if (fileCache && stamp === fileCacheStamp) {
+    return fileCache;
+  }
+
+  const data = await fs.readFile(CACHE_FILE, 'utf-8');
+  fileCache = JSON.parse(data);
+  fileCacheStamp = stamp;
+  return fileCache;
+}
+
+/**
+ * Persist the JSON file cache atomically
+ * Writes compact JSON to a temp file and renames it over the cache file,
+ * so concurrent readers never observe a partially written file
+ * @param {object} cache - Full cache object to persist
+ */
+async function writeCacheFile(cache) {
+  const tmpFile = `${CACHE_FILE}.${process.pid}.${writeSeq++}.tmp`;
+  try {
+    await fs.writeFile(tmpFile, JSON.stringify(cache));
+    await fs.rename(tmpFile, CACHE_FILE);
+    fileCache = cache;
+    fileCacheStamp = fileStamp(await fs.stat(CACHE_FILE));
+  } catch (error) {
+    await fs.unlink(tmpFile).catch(() => {});
+    throw error;
+  }
+}
+
+/**
+ * Queue a JSON file cache write
+ * Writes arriving within the flush window are applied in a single
+ * read-modify-write, and flushes never overlap
+ * @param {string} normalizedKey - Normalized cache key
+ * @param {object|null} value - Entry to store, or null to delete
+ * @returns {Promise<boolean>} Resolves once the batch is persisted
+ */
+function enqueueWrite(normalizedKey, value) {
+  pendingWrites.set(normalizedKey, value);
+  unflushedWrites.set(normalizedKey, value);
+
+  if (!scheduledFlush) {
+    scheduledFlush = new Promise(resolve => { resolveScheduledFlush = resolve; });
+    flushTimer = setTimeout(startFlush, CACHE_CONFIG.writeFlushMs);
+  }
+
+  return scheduledFlush;
+}
+
+/**
+ * Hand the pending batch to the flush chain (timer callback or flushCache)
+ * @returns {Promise<boolean>} Resolves once the batch is persisted
+ */
+function startFlush() {
+  clearTimeout(flushTimer);
+  flushTimer = null;
+
+  const batch = pendingWrites;
+  const resolve = resolveScheduledFlush;
+  pendingWrites = new Map();
+  scheduledFlush = null;
+  resolveScheduledFlush = null;
+
+  flushChain = flushChain.then(() => flushWrites(batch));
+  resolve(flushChain);
+  return flushChain;
+}
+
+/**
+ * Persist any queued JSON file cache writes immediately
+ * Call before the process exits so writes from the last flush window aren't lost
+ * @returns {Promise<boolean>} Result of the last flush
+ */
+export async function flushCache() {
+  if (scheduledFlush) {
+    startFlush();
+  }
+  return flushChain;
+}
+
+/**
+ * Apply a batch of queued writes to the JSON file cache
+ * @param {Map<string, object|null>} batch - Pending writes keyed by normalized key
+ * @returns {Promise<boolean>}
+ */
+async function flushWrites(batch) {
+  try {
+    let cache = {};
+    try {
+      cache = await loadCacheFile();
+    } catch {
+      // File doesn't exist, start fresh
+    }
+
+    for (const [key, value] of batch) {
+      if (value === null) {
+        delete cache[key];
+      } else {
+        cache[key] = value;
+      }
+    }
+
+    // Sweep expired entries on an interval rather than on every write
+    if (Date.now() - lastPurgeAt >= CACHE_CONFIG.purgeInterval) {
+      purgeExpired(cache);
+      lastPurgeAt = Date.now();
+    }
+
+    // LRU eviction if needed
+    const overflow = Object.keys(cache).length - CACHE_CONFIG.maxEntries;
+    if (overflow > 0) {
+      evictLRU(cache, Math.max(overflow, Math.floor(CACHE_CONFIG.maxEntries * 0.1))); // Evict at least 10%
+    }
+
+    await writeCacheFile(cache);
+    return true;
+  } catch (error) {
+    logger.error({ error: error.message, batchSize: batch.size }, 'Failed to save cache');
+    // In-memory copy may hold unpersisted changes; reload from disk next time
+    fileCache = null;
+    return false;
+  } finally {
+    // Drop entries unless a newer write for the same key is still queued
+    for (const [key, value] of batch) {
+      if (unflushedWrites.get(key) === value) {
+        unflushedWrites.delete(key);
+      }
+    }
+  }
+}
+
 /**
  * Get item from cache
  * Returns the cached value with metadata, or null if not found/expired
@@ -90,25 +308,102 @@ export async function cacheGet(key, options = {}) {
   let entry = null;
 
   if (useKV && kvClient) {
+    const kvKey = `${CACHE_PREFIX}${normalizedKey}`;
     try {
-      entry = await kvClient.get(`${CACHE_PREFIX}${normalizedKey}`);
+      entry = memoryGet(kvKey);
+      if (entry === undefined) {
+        entry = await kvClient.get(kvKey);
+        if (entry) memorySet(kvKey, entry);
+      }
     } catch (error) {
       logger.error({ error: error.message }, 'KV get error');
       return null;
     }
   } else {
     // Fallback to JSON file
-    try {
-      const data = await fs.readFile(CACHE_FILE, 'utf-8');
-      const cache = JSON.parse(data);
-      entry = cache[normalizedKey];
-    } catch {
-      return null;
-    }
+    entry = await readFileEntry(normalizedKey);
   }
 
   if (!entry) return null;
+  return decorateEntry(normalizedKey, entry, allowStale);
+}
 
+/**
+ * Look up a title's cache entry and, on a miss, its negative cache entry
+ * Needs a single backend access (one KV MGET round trip, or one JSON file
+ * probe) instead of separate reads of the paper and negative keys
+ * @param {string} key - Paper title
+ * @param {{ normalized?: boolean }} [options] - normalized: key is already normalized
+ * @returns {Promise<{ entry: object|null, negative: object|null }>}
+ *   entry as returned by cacheGet, negative flagged as cached (KV only)
+ */
+export async function cacheLookup(key, options = {}) {
+  await initCache();
+  const normalizedKey = toCacheKey(key, options);
+
+  if (useKV && kvClient) {
+    const kvKey = `${CACHE_PREFIX}${normalizedKey}`;
+    const negativeKey = `${NEGATIVE_CACHE_PREFIX}${normalizedKey}`;
+    let entry = memoryGet(kvKey);
+    let negative = null;
+
+    // Recent negative result in L1 - skip KV entirely
+    if (entry === undefined) {
+      const cachedNegative = memoryGet(negativeKey);
+      if (cachedNegative !== undefined) {
+        return { entry: null, negative: { ...cachedNegative, cached: true } };
+      }
+    }
+
+    if (entry === undefined) {
+      try {
+        [entry, negative] = await kvClient.mget(kvKey, negativeKey);
+      } catch (error) {
+        logger.error({ error: error.message }, 'KV get error');
+        return { entry: null, negative: null };
+      }
+      if (entry) memorySet(kvKey, entry);
+      if (negative) memorySet(negativeKey, negative);
+    }
+
+    if (entry) {
+      return { entry: decorateEntry(normalizedKey, entry, true), negative: null };
+    }
+    return { entry: null, negative: negative ? { ...negative, cached: true } : null };
+  }
+
+  // JSON file keeps negative results under the same key, so one probe covers both
+  const entry = await readFileEntry(normalizedKey);
+  return { entry: entry ? decorateEntry(normalizedKey, entry, true) : null, negative: null };
+}
+
+/**
+ * Read an entry from the JSON file cache, including queued writes
+ * @param {string} normalizedKey - Normalized cache key
+ * @returns {Promise<object|null>}
+ */
+async function readFileEntry(normalizedKey) {
+  if (unflushedWrites.has(normalizedKey)) {
+    // Queued write not yet flushed to disk
+    return unflushedWrites.get(normalizedKey);
+  }
+
+  try {
+    const cache = await loadCacheFile();
+    return cache[normalizedKey] || null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Attach staleness info to a raw cache entry
+ * @param {string} normalizedKey - Normalized cache key
+ * @param {object} entry - Raw entry from the backend
+ * @param {boolean} allowStale - Whether to return expired entries
+ * @returns {object|null} Decorated copy, or null if expired and not allowed
+ */
+function decorateEntry(normalizedKey, entry, allowStale) {
   // Check staleness
   const isNegative = entry.success === false;
   const { expired, stale } = checkStaleness(entry, isNegative);
@@ -130,10 +425,15 @@ export async function cacheGet(key, options = {}) {
 
 /**
  * Set item in cache with timestamp
+ * KV writes resolve once stored; JSON file writes resolve once queued
+ * for the next batched flush (see flushCache)
+ * @param {string} key - Paper title
+ * @param {object} value - Result to cache
+ * @param {{ normalized?: boolean }} [options] - normalized: key is already normalized
  */
-export async function cacheSet(key, value) {
+export async function cacheSet(key, value, options = {}) {
   await initCache();
-  const normalizedKey = normalizeTitle(key);
+  const normalizedKey = toCacheKey(key, options);
 
   // Add timestamp to the cached value
   const valueWithTimestamp = {
@@ -142,8 +442,10 @@ export async function cacheSet(key, value) {
   };
 
   if (useKV && kvClient) {
+    const kvKey = `${CACHE_PREFIX}${normalizedKey}`;
     try {
-      await kvClient.set(`${CACHE_PREFIX}${normalizedKey}`, valueWithTimestamp, { ex: CACHE_TTL });
+      await kvClient.set(kvKey, valueWithTimestamp, { ex: CACHE_TTL });
+      memorySet(kvKey, valueWithTimestamp);
       return true;
     } catch (error) {
       logger.error({ error: error.message }, 'KV set error');
@@ -151,29 +453,10 @@ export async function cacheSet(key, value) {
     }
   }
 
-  // Fallback to JSON file
-  try {
-    let cache = {};
-    try {
-      const data = await fs.readFile(CACHE_FILE, 'utf-8');
-      cache = JSON.parse(data);
-    } catch {
-      // File doesn't exist, start fresh
-    }
-
-    // LRU eviction if needed
-    const entries = Object.entries(cache);
-    if (entries.length >= CACHE_CONFIG.maxEntries) {
-      await evictLRU(cache, Math.floor(CACHE_CONFIG.maxEntries * 0.1)); // Evict 10%
-    }
-
-    cache[normalizedKey] = valueWithTimestamp;
-    await fs.writeFile(CACHE_FILE, JSON.stringify(cache, null, 2));
-    return true;
-  } catch (error) {
-    logger.error({ error: error.message }, 'Failed to save cache');
-    return false;
-  }
+  // Fallback to JSON file (batched) - don't hold the caller for the flush
+  // window; flushWrites logs its own failures
+  enqueueWrite(normalizedKey, valueWithTimestamp);
+  return true;
 }
 
 /**
@@ -184,8 +467,10 @@ export async function cacheDelete(key) {
   const normalizedKey = normalizeTitle(key);
 
   if (useKV && kvClient) {
+    const kvKey = `${CACHE_PREFIX}${normalizedKey}`;
+    memoryCache.delete(kvKey);
     try {
-      await kvClient.del(`${CACHE_PREFIX}${normalizedKey}`);
+      await kvClient.del(kvKey);
       return true;
     } catch (error) {
       logger.error({ error: error.message }, 'KV delete error');
@@ -193,16 +478,8 @@ export async function cacheDelete(key) {
     }
   }
 
-  // Fallback to JSON file
-  try {
-    const data = await fs.readFile(CACHE_FILE, 'utf-8');
-    const cache = JSON.parse(data);
-    delete cache[normalizedKey];
-    await fs.writeFile(CACHE_FILE, JSON.stringify(cache, null, 2));
-    return true;
-  } catch {
-    return false;
-  }
+  // Fallback to JSON file (batched)
+  return enqueueWrite(normalizedKey, null);
 }
 
 /**
@@ -213,6 +490,24 @@ export async function isUsingKV() {
   return useKV;
 }
 
+/**
+ * Remove expired entries from the JSON file cache
+ * @param {object} cache - Cache object to modify in place
+ */
+function purgeExpired(cache) {
+  let purged = 0;
+  for (const [key, entry] of Object.entries(cache)) {
+    if (checkStaleness(entry, entry?.success === false).expired) {
+      delete cache[key];
+      purged++;
+    }
+  }
+
+  if (purged > 0) {
+    logger.info({ purged }, 'Purged expired cache entries');
+  }
+}
+
 /**
  * LRU eviction for JSON file cache
  * Removes oldest entries based on cachedAt timestamp
@@ -220,18 +515,18 @@ export async function isUsingKV() {
  * @param {number} count - Number of entries to evict
  */
 function evictLRU(cache, count) {
-  const entries = Object.entries(cache);
+  // Parse each timestamp once up front instead of inside the comparator
+  const entries = Object.entries(cache).map(([key, entry]) => ({
+    key,
+    time: entry?.cachedAt ? new Date(entry.cachedAt).getTime() : 0
+  }));
 
   // Sort by cachedAt timestamp (oldest first)
-  entries.sort((a, b) => {
-    const timeA = a[1]?.cachedAt ? new Date(a[1].cachedAt).getTime() : 0;
-    const timeB = b[1]?.cachedAt ? new Date(b[1].cachedAt).getTime() : 0;
-    return timeA - timeB;
-  });
+  entries.sort((a, b) => a.time - b.time);
 
   // Delete oldest entries
   const toDelete = entries.slice(0, count);
-  for (const [key] of toDelete) {
+  for (const { key } of toDelete) {
     delete cache[key];
   }
 
@@ -242,10 +537,11 @@ function evictLRU(cache, count) {
  * Set negative cache (for failed lookups)
  * @param {string} key - Paper title
  * @param {object} result - The failed result to cache
+ * @param {{ normalized?: boolean }} [options] - normalized: key is already normalized
  */
-export async function cacheSetNegative(key, result) {
+export async function cacheSetNegative(key, result, options = {}) {
   await initCache();
-  const normalizedKey = normalizeTitle(key);
+  const normalizedKey = toCacheKey(key, options);
 
   const valueWithTimestamp = {
     ...result,
@@ -255,10 +551,12 @@ export async function cacheSetNegative(key, result) {
   };
 
   if (useKV && kvClient) {
+    const kvKey = `${NEGATIVE_CACHE_PREFIX}${normalizedKey}`;
     try {
       // Shorter TTL for negative cache (1 day)
       const negativeTTL = 60 * 60 * 24;
-      await kvClient.set(`${NEGATIVE_CACHE_PREFIX}${normalizedKey}`, valueWithTimestamp, { ex: negativeTTL });
+      await kvClient.set(kvKey, valueWithTimestamp, { ex: negativeTTL });
+      memorySet(kvKey, valueWithTimestamp);
       return true;
     } catch (error) {
       logger.error({ error: error.message }, 'KV negative cache set error');
@@ -266,52 +564,29 @@ export async function cacheSetNegative(key, result) {
     }
   }
 
-  // JSON file negative caching is handled by normal cacheSet with success: false
-  return cacheSet(key, valueWithTimestamp);
-}
-
-/**
- * Get negative cache entry
- * @param {string} key - Paper title
- */
-export async function cacheGetNegative(key) {
-  await initCache();
-  const normalizedKey = normalizeTitle(key);
-
-  if (useKV && kvClient) {
-    try {
-      const result = await kvClient.get(`${NEGATIVE_CACHE_PREFIX}${normalizedKey}`);
-      if (!result) return null;
-      return { ...result, cached: true };
-    } catch (error) {
-      logger.error({ error: error.message }, 'KV negative cache get error');
-      return null;
-    }
-  }
-
-  // For JSON file, negative cache is stored with isNegativeCache flag
-  const entry = await cacheGet(key);
-  if (entry?.isNegativeCache) {
-    return entry;
-  }
-  return null;
+  // JSON file keeps negative results under the normal key with success: false
+  // (entry is already stamped, so queue it directly rather than via cacheSet)
+  enqueueWrite(normalizedKey, valueWithTimestamp);
+  return true;
 }
 
 /**
  * Mark a key as being revalidated (to prevent duplicate revalidation)
  * @param {string} key - Paper title
+ * @param {{ normalized?: boolean }} [options] - normalized: key is already normalized
  */
-export function markRevalidating(key) {
-  const normalizedKey = normalizeTitle(key);
+export function markRevalidating(key, options = {}) {
+  const normalizedKey = toCacheKey(key, options);
   revalidationQueue.add(normalizedKey);
 }
 
 /**
  * Mark revalidation complete
  * @param {string} key - Paper title
+ * @param {{ normalized?: boolean }} [options] - normalized: key is already normalized
  */
-export function markRevalidationComplete(key) {
-  const normalizedKey = normalizeTitle(key);
+export function markRevalidationComplete(key, options = {}) {
+  const normalizedKey = toCacheKey(key, options);
   revalidationQueue.delete(normalizedKey);
 }
 
@@ -332,12 +607,11 @@ export async function getCacheStats() {
   await initCache();
 
   if (useKV) {
-    return { type: 'vercel-kv', stats: 'Not available for KV' };
+    return { type: 'vercel-kv', stats: 'Not available for KV', memoryEntries: memoryCache.size };
   }
 
   try {
-    const data = await fs.readFile(CACHE_FILE, 'utf-8');
-    const cache = JSON.parse(data);
+    const cache = await loadCacheFile();
     const entries = Object.entries(cache);
 
     let successCount = 0;
@@ -1,9 +1,11 @@
-import { parseStringPromise } from 'xml2js';
-import axios from 'axios';
+import * as cheerio from 'cheerio';
+import httpClient from '../httpClient.mjs';
 import { isTitleMatch } from '../utils/titleMatch.mjs';
 import { validatePdfUrl } from '../utils/pdfValidator.mjs';
 import { withRetry } from './baseFetcher.mjs';
 
+const WHITESPACE = /\s+/g;
+
 /**
  * ArXiv fetcher - searches for papers on arXiv and returns PDF URLs
  * ArXiv is a free preprint repository with direct PDF access
@@ -20,24 +22,29 @@ export async function fetchFromArxiv(title) {
     };
 
     const response = await withRetry(() =>
-      axios.get(searchUrl, { params, timeout: 10000 })
+      httpClient.get(searchUrl, { params, timeout: 10000 })
     );
-    const data = await parseStringPromise(response.data);
+    // Parse with cheerio in XML mode - its htmlparser2 tokenizer is much
+    // faster than the sax parser behind xml2js
+    const $ = cheerio.load(response.data, { xml: true });
+    const entries = $('feed > entry');
 
-    if (!data.feed.entry || data.feed.entry.length === 0) {
+    if (entries.length === 0) {
       return { success: false, error: 'No results found on arXiv' };
     }
 
     // Loop through results and validate title match
-    for (const entry of data.feed.entry) {
-      const resultTitle = entry.title[0].replace(/\s+/g, ' ').trim();
+    for (const element of entries) {
+      const entry = $(element);
+      const resultTitle = entry.children('title').text().replace(WHITESPACE, ' ').trim();
 
       // Validate title similarity to avoid false positives
       if (!isTitleMatch(title, resultTitle)) {
         continue;
       }
 
-      const arxivId = entry.id[0].split('/abs/')[1];
+      const arxivId = entry.children('id').text().trim().split('/abs/')[1];
+      const authors = entry.children('author').children('name').map((_, name) => $(name).text()).get();
       const pdfUrl = `https://arxiv.org/pdf/${arxivId}.pdf`;
 
       // Verify the PDF exists and is actually a PDF
@@ -49,8 +56,8 @@ export async function fetchFromArxiv(title) {
           source: 'arXiv',
           metadata: {
             title: resultTitle,
-            authors: entry.author?.map(a => a.name[0]).join(', '),
-            published: entry.published[0],
+            authors: authors.length > 0 ? authors.join(', ') : undefined,
+            published: entry.children('published').text(),
             arxivId
           }
         };
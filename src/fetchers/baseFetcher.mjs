@@ -1,4 +1,4 @@
-import axios from 'axios';
+import httpClient from '../httpClient.mjs';
 import { classifyError, isRetryable, getRetryDelay, RateLimitError } from '../errors.mjs';
 
 const DEFAULT_TIMEOUT = 10000;
@@ -24,7 +24,7 @@ export async function fetchWithRetry(url, options, parser) {
 
   for (let attempt = 0; attempt <= retries; attempt++) {
     try {
-      const response = await axios.get(url, {
+      const response = await httpClient.get(url, {
         ...axiosOptions,
         timeout
       });
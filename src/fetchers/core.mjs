@@ -1,4 +1,4 @@
-import axios from 'axios';
+import httpClient from '../httpClient.mjs';
 import { withRetry } from './baseFetcher.mjs';
 import { validatePdfUrl } from '../utils/pdfValidator.mjs';
 
@@ -16,7 +16,7 @@ export async function fetchFromCore(title) {
     };
 
     const response = await withRetry(() =>
-      axios.get(searchUrl, { params, timeout: 10000 })
+      httpClient.get(searchUrl, { params, timeout: 10000 })
     );
 
     if (!response.data.results || response.data.results.length === 0) {
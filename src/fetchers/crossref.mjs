@@ -1,4 +1,4 @@
-import axios from 'axios';
+import httpClient from '../httpClient.mjs';
 import { isTitleMatch } from '../utils/titleMatch.mjs';
 import { withRetry } from './baseFetcher.mjs';
 
@@ -17,7 +17,7 @@ export async function fetchFromCrossref(title) {
     };
 
     const response = await withRetry(() =>
-      axios.get(searchUrl, { params, timeout: 15000 })
+      httpClient.get(searchUrl, { params, timeout: 15000 })
     );
 
     if (!response.data.message?.items || response.data.message.items.length === 0) {
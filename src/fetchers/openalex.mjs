@@ -1,21 +1,24 @@
 import { fetchWithRetry, successResult, failureResult } from './baseFetcher.mjs';
 import { isTitleMatch } from '../utils/titleMatch.mjs';
+import { normalizeDoi } from '../utils/doi.mjs';
+
+const SEARCH_URL = 'https://api.openalex.org/works';
+const MAILTO = process.env.UNPAYWALL_EMAIL || 'example@example.com';
 
 /**
  * OpenAlex fetcher - free and open catalog of scholarly papers
  * Now validates title similarity to avoid false positives
  */
 export async function fetchFromOpenAlex(title) {
-  const url = 'https://api.openalex.org/works';
   const options = {
     params: {
       search: title,
       per_page: 5,
-      mailto: process.env.UNPAYWALL_EMAIL || 'example@example.com'
+      mailto: MAILTO
     }
   };
 
-  return fetchWithRetry(url, options, (data) => {
+  return fetchWithRetry(SEARCH_URL, options, (data) => {
     if (!data.results || data.results.length === 0) {
       return failureResult('No results found on OpenAlex');
     }
@@ -36,7 +39,7 @@ export async function fetchFromOpenAlex(title) {
           title: work.title,
           authors: work.authorships?.map(a => a.author?.display_name).filter(Boolean).join(', '),
           year: work.publication_year,
-          doi: work.doi?.replace('https://doi.org/', ''),
+          doi: normalizeDoi(work.doi) ?? undefined,
           isOpenAccess: work.open_access?.is_oa
         });
       }
@@ -47,7 +50,7 @@ export async function fetchFromOpenAlex(title) {
       if (isTitleMatch(title, work.title) && work.doi) {
         return failureResult(
           'No open access PDF found on OpenAlex',
-          work.doi.replace('https://doi.org/', '')
+          normalizeDoi(work.doi)
         );
       }
     }
@@ -1,5 +1,4 @@
-import axios from 'axios';
-import { parseStringPromise } from 'xml2js';
+import httpClient from '../httpClient.mjs';
 import { withRetry } from './baseFetcher.mjs';
 
 /**
@@ -19,7 +18,7 @@ export async function fetchFromPubMed(title) {
     };
 
     const searchResponse = await withRetry(() =>
-      axios.get(searchUrl, { params: searchParams, timeout: 10000 })
+      httpClient.get(searchUrl, { params: searchParams, timeout: 10000 })
     );
     const ids = searchResponse.data.esearchresult?.idlist;
 
@@ -37,7 +36,7 @@ export async function fetchFromPubMed(title) {
     };
 
     const linkResponse = await withRetry(() =>
-      axios.get(linkUrl, { params: linkParams, timeout: 10000 })
+      httpClient.get(linkUrl, { params: linkParams, timeout: 10000 })
     );
     const pmcId = linkResponse.data.linksets?.[0]?.linksetdbs?.find(
       ls => ls.dbto === 'pmc'
@@ -56,7 +55,7 @@ export async function fetchFromPubMed(title) {
     };
 
     const summaryResponse = await withRetry(() =>
-      axios.get(summaryUrl, { params: summaryParams, timeout: 10000 })
+      httpClient.get(summaryUrl, { params: summaryParams, timeout: 10000 })
     );
     const article = summaryResponse.data.result?.[pmcId];
 
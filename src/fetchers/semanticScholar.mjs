@@ -1,8 +1,16 @@
-import axios from 'axios';
+import httpClient from '../httpClient.mjs';
 import { isTitleMatch } from '../utils/titleMatch.mjs';
 import { withRetry } from './baseFetcher.mjs';
 import { validatePdfUrl } from '../utils/pdfValidator.mjs';
 
+const SEARCH_URL = 'https://api.semanticscholar.org/graph/v1/paper/search';
+const FIELDS = 'title,authors,year,openAccessPdf,externalIds,url';
+
+// Request headers don't vary per call, so build them once
+const HEADERS = process.env.SEMANTIC_SCHOLAR_API_KEY
+  ? { 'x-api-key': process.env.SEMANTIC_SCHOLAR_API_KEY }
+  : {};
+
 /**
  * Semantic Scholar fetcher - uses S2 API to find papers and their open access PDFs
  * Validates title similarity to avoid false positives
@@ -10,20 +18,14 @@ import { validatePdfUrl } from '../utils/pdfValidator.mjs';
  */
 export async function fetchFromSemanticScholar(title) {
   try {
-    const searchUrl = 'https://api.semanticscholar.org/graph/v1/paper/search';
     const params = {
       query: title,
       limit: 5,
-      fields: 'title,authors,year,openAccessPdf,externalIds,url'
+      fields: FIELDS
     };
 
-    const headers = {};
-    if (process.env.SEMANTIC_SCHOLAR_API_KEY) {
-      headers['x-api-key'] = process.env.SEMANTIC_SCHOLAR_API_KEY;
-    }
-
     const response = await withRetry(() =>
-      axios.get(searchUrl, { params, headers, timeout: 10000 })
+      httpClient.get(SEARCH_URL, { params, headers: HEADERS, timeout: 10000 })
     );
 
     if (!response.data.data || response.data.data.length === 0) {
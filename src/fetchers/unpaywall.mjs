@@ -1,12 +1,14 @@
-import axios from 'axios';
+import httpClient from '../httpClient.mjs';
 import { withRetry } from './baseFetcher.mjs';
 
+const DEFAULT_EMAIL = process.env.UNPAYWALL_EMAIL || 'example@example.com';
+
 /**
  * Unpaywall fetcher - finds legal open access versions of papers via DOI
  * Requires a DOI to work, so this depends on finding the DOI first
  * Now with retry logic for transient failures
  */
-export async function fetchFromUnpaywall(doi, email = process.env.UNPAYWALL_EMAIL || 'example@example.com') {
+export async function fetchFromUnpaywall(doi, email = DEFAULT_EMAIL) {
   try {
     if (!doi) {
       return { success: false, error: 'DOI required for Unpaywall' };
@@ -16,7 +18,7 @@ export async function fetchFromUnpaywall(doi, email = process.env.UNPAYWALL_EMAI
     const params = { email };
 
     const response = await withRetry(() =>
-      axios.get(url, { params, timeout: 10000 })
+      httpClient.get(url, { params, timeout: 10000 })
     );
     const data = response.data;
 
@@ -1,7 +1,12 @@
-import axios from 'axios';
+import httpClient from '../httpClient.mjs';
 import { isTitleMatch } from '../utils/titleMatch.mjs';
 
 const BRAVE_API_KEY = process.env.BRAVE_API_KEY;
+const SEARCH_URL = 'https://api.search.brave.com/res/v1/web/search';
+const HEADERS = {
+  'X-Subscription-Token': BRAVE_API_KEY,
+  'Accept': 'application/json'
+};
 
 // Trusted academic domains for PDF downloads
 const TRUSTED_DOMAINS = [
@@ -46,15 +51,12 @@ export async function fetchFromWebSearch(title) {
     // Search for paper title + PDF/preprint
     const query = `"${title}" filetype:pdf OR preprint`;
     
-    const response = await axios.get('https://api.search.brave.com/res/v1/web/search', {
+    const response = await httpClient.get(SEARCH_URL, {
       params: {
         q: query,
         count: 10
       },
-      headers: {
-        'X-Subscription-Token': BRAVE_API_KEY,
-        'Accept': 'application/json'
-      },
+      headers: HEADERS,
       timeout: 15000
     });
 
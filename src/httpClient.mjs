@@ -0,0 +1,24 @@
+import http from 'http';
+import https from 'https';
+import axios from 'axios';
+
+/**
+ * Shared HTTP client for source fetchers and PDF downloads
+ * Keep-alive agents let repeated requests to the same host (PubMed's
+ * three E-utilities calls, back-to-back lookups, PDF downloads) reuse
+ * TCP/TLS connections instead of handshaking on every call
+ */
+
+const AGENT_CONFIG = {
+  keepAlive: true,
+  maxSockets: 64,       // Max concurrent sockets per host
+  maxFreeSockets: 64,   // Idle sockets kept open per host
+  timeout: 60000        // Close sockets idle for 60s
+};
+
+export const httpAgent = new http.Agent(AGENT_CONFIG);
+export const httpsAgent = new https.Agent(AGENT_CONFIG);
+
+const httpClient = axios.create({ httpAgent, httpsAgent });
+
+export default httpClient;
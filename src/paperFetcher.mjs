@@ -4,7 +4,7 @@
 
 import fs from 'fs/promises';
 import path from 'path';
-import axios from 'axios';
+import httpClient from './httpClient.mjs';
 import { fetchFromArxiv } from './fetchers/arxiv.mjs';
 import { fetchFromSemanticScholar } from './fetchers/semanticScholar.mjs';
 import { fetchFromUnpaywall } from './fetchers/unpaywall.mjs';
@@ -13,7 +13,8 @@ import { fetchFromCore } from './fetchers/core.mjs';
 import { fetchFromOpenAlex } from './fetchers/openalex.mjs';
 import { fetchFromPubMed } from './fetchers/pubmed.mjs';
 import { fetchFromWebSearch } from './fetchers/webSearch.mjs';
-import { cacheGet, cacheSet, cacheSetNegative, cacheGetNegative, normalizeTitle, markRevalidating, markRevalidationComplete } from './cache.mjs';
+import { normalizeDoi } from './utils/doi.mjs';
+import { cacheLookup, cacheSet, cacheSetNegative, normalizeTitle, markRevalidating, markRevalidationComplete } from './cache.mjs';
 import { createFetchLogger, generateCorrelationId, logSourceTiming } from './logger.mjs';
 import { withCircuitBreaker, isSourceHealthy, getAllCircuitBreakerStatus } from './circuitBreaker.mjs';
 
@@ -43,7 +44,8 @@ async function downloadPdf(url, title) {
     const filepath = path.join(PDF_STORAGE_PATH, filename);
 
     // Download PDF
-    const response = await axios.get(url, {
+    // Shared keep-alive client so downloads reuse pooled connections
+    const response = await httpClient.get(url, {
       responseType: 'arraybuffer',
       timeout: 60000,
       maxContentLength: 100 * 1024 * 1024, // 100MB max
@@ -75,6 +77,24 @@ const SOURCE_PRIORITY = {
   'Unpaywall': 8
 };
 
+/**
+ * Title-based fetching strategies, sorted by priority (fastest/most reliable first)
+ * Built once at load time rather than per request
+ */
+const STRATEGIES = Object.freeze([
+  { name: 'arXiv', fn: fetchFromArxiv },
+  { name: 'Semantic Scholar', fn: fetchFromSemanticScholar },
+  { name: 'OpenAlex', fn: fetchFromOpenAlex },
+  { name: 'PubMed Central', fn: fetchFromPubMed },
+  { name: 'CORE', fn: fetchFromCore },
+  { name: 'Crossref', fn: fetchFromCrossref },
+  { name: 'Web Search', fn: fetchFromWebSearch },
+].sort((a, b) =>
+  (SOURCE_PRIORITY[a.name] || 99) - (SOURCE_PRIORITY[b.name] || 99)
+));
+
+const STRATEGY_NAMES = Object.freeze(STRATEGIES.map(s => s.name));
+
 // Concurrency configuration
 const CONCURRENCY_CONFIG = {
   maxConcurrent: 4,       // Max sources to query simultaneously
@@ -82,34 +102,72 @@ const CONCURRENCY_CONFIG = {
 };
 
 /**
- * Run promises with limited concurrency
- * @param {Array<function>} tasks - Array of async functions to run
+ * Run prioritized tasks with limited concurrency, stopping at the best result
+ * Resolves as soon as a task succeeds and every higher-priority task has
+ * settled, so lower-priority stragglers don't hold up the response.
+ * Tasks that haven't started by then are never launched.
+ * @param {Array<function>} tasks - Async functions, highest priority first
  * @param {number} limit - Max concurrent tasks
- * @returns {Promise<Array>}
+ * @param {function} isSuccess - Predicate applied to fulfilled values
+ * @returns {Promise<Array>} Settled outcomes (allSettled format) in priority order
  */
-async function runWithConcurrencyLimit(tasks, limit) {
-  const results = [];
-  const executing = new Set();
+function runUntilBestResult(tasks, limit, isSuccess) {
+  return new Promise((resolve) => {
+    const settled = new Array(tasks.length);
+    let next = 0;
+    let running = 0;
+    let frontier = 0; // First task whose outcome is still unknown
+    let done = false;
+
+    const finish = () => {
+      done = true;
+      resolve(settled.filter(Boolean));
+    };
 
-  for (const task of tasks) {
-    const promise = Promise.resolve().then(() => task());
-    results.push(promise);
-    executing.add(promise);
+    const launch = () => {
+      while (!done && running < limit && next < tasks.length) {
+        const index = next++;
+        running++;
+
+        Promise.resolve()
+          .then(() => tasks[index]())
+          .then(
+            value => ({ status: 'fulfilled', value }),
+            reason => ({ status: 'rejected', reason })
+          )
+          .then((outcome) => {
+            running--;
+            settled[index] = outcome;
+            if (done) return;
+
+            // Advance past settled higher-priority tasks; the first success wins
+            while (frontier < tasks.length && settled[frontier]) {
+              const current = settled[frontier];
+              if (current.status === 'fulfilled' && isSuccess(current.value)) {
+                return finish();
+              }
+              frontier++;
+            }
 
-    const cleanup = () => executing.delete(promise);
-    promise.then(cleanup, cleanup);
+            if (frontier === tasks.length) {
+              return finish();
+            }
+            launch();
+          });
+      }
+    };
 
-    if (executing.size >= limit) {
-      await Promise.race(executing);
+    if (tasks.length === 0) {
+      resolve([]);
+      return;
     }
-  }
-
-  return Promise.allSettled(results);
+    launch();
+  });
 }
 
 /**
  * Main paper fetcher with parallel fetching strategy
- * Runs all sources in parallel for speed, picks best result
+ * Runs sources in parallel, returning once the best-priority result is known
  * Deduplicates concurrent requests for the same paper
  * @param {string} title - Paper title to search for
  * @param {FetchOptions} [options] - Fetch options
@@ -120,41 +178,35 @@ export async function fetchPaper(title, options = {}) {
 
   const log = createFetchLogger(title);
 
-  // Check cache first
+  // Check cache first (positive and negative entries in one lookup)
   if (!options.skipCache) {
-    const cached = await cacheGet(title);
+    const { entry: cached, negative: negativeCached } = await cacheLookup(normalizedKey, { normalized: true });
     if (cached) {
       log.info({ stale: cached.stale }, 'Cache hit');
 
       // If stale and needs revalidation, trigger background refresh
       if (cached.needsRevalidation && !cached.expired) {
         log.info('Triggering background revalidation');
-        markRevalidating(title);
+        markRevalidating(normalizedKey, { normalized: true });
         // Fire and forget - don't await
-        fetchPaperInternal(title, { ...options, skipCache: true })
+        fetchPaperInternal(title, { ...options, skipCache: true }, normalizedKey)
           .then(result => {
             if (result.success) {
-              cacheSet(title, result);
+              cacheSet(normalizedKey, result, { normalized: true });
             }
           })
           .catch(() => {})
-          .finally(() => markRevalidationComplete(title));
+          .finally(() => markRevalidationComplete(normalizedKey, { normalized: true }));
       }
 
-      return {
-        ...cached,
-        cached: true
-      };
+      // cacheLookup already returns a fresh object flagged as cached
+      return cached;
     }
 
     // Check negative cache (failed lookups)
-    const negativeCached = await cacheGetNegative(title);
     if (negativeCached && !negativeCached.expired) {
       log.info('Negative cache hit (previously not found)');
-      return {
-        ...negativeCached,
-        cached: true
-      };
+      return negativeCached;
     }
   }
 
@@ -165,7 +217,7 @@ export async function fetchPaper(title, options = {}) {
   }
 
   // Create promise for this request and store it
-  const fetchPromise = fetchPaperInternal(title, options);
+  const fetchPromise = fetchPaperInternal(title, options, normalizedKey);
   inflightRequests.set(normalizedKey, fetchPromise);
 
   try {
@@ -179,25 +231,17 @@ export async function fetchPaper(title, options = {}) {
 
 /**
  * Internal fetch implementation (called by deduplicating wrapper)
+ * @param {string} title - Paper title to search for
+ * @param {FetchOptions} [options] - Fetch options
+ * @param {string} [normalizedKey] - Cache key for title, if the caller already has it
  */
-async function fetchPaperInternal(title, options = {}) {
+async function fetchPaperInternal(title, options = {}, normalizedKey = normalizeTitle(title)) {
   const correlationId = options.correlationId || generateCorrelationId();
   const log = createFetchLogger(title, correlationId);
   log.info({ correlationId }, 'Fetching paper');
 
-  // Define fetching strategies
-  const strategies = [
-    { name: 'arXiv', fn: () => fetchFromArxiv(title) },
-    { name: 'Semantic Scholar', fn: () => fetchFromSemanticScholar(title) },
-    { name: 'OpenAlex', fn: () => fetchFromOpenAlex(title) },
-    { name: 'PubMed Central', fn: () => fetchFromPubMed(title) },
-    { name: 'CORE', fn: () => fetchFromCore(title) },
-    { name: 'Crossref', fn: () => fetchFromCrossref(title) },
-    { name: 'Web Search', fn: () => fetchFromWebSearch(title) },
-  ];
-
-  // Filter out sources with open circuit breakers
-  const healthyStrategies = strategies.filter(s => {
+  // Filter out sources with open circuit breakers (keeps priority order)
+  const healthyStrategies = STRATEGIES.filter(s => {
     const healthy = isSourceHealthy(s.name);
     if (!healthy) {
       log.info({ source: s.name }, 'Skipping source (circuit breaker open)');
@@ -205,14 +249,9 @@ async function fetchPaperInternal(title, options = {}) {
     return healthy;
   });
 
-  // Sort strategies by priority (fastest/most reliable first)
-  healthyStrategies.sort((a, b) =>
-    (SOURCE_PRIORITY[a.name] || 99) - (SOURCE_PRIORITY[b.name] || 99)
-  );
-
   log.info({
     sourceCount: healthyStrategies.length,
-    skipped: strategies.length - healthyStrategies.length,
+    skipped: STRATEGIES.length - healthyStrategies.length,
     maxConcurrent: CONCURRENCY_CONFIG.maxConcurrent
   }, 'Trying sources with limited concurrency');
 
@@ -220,7 +259,7 @@ async function fetchPaperInternal(title, options = {}) {
   const tasks = healthyStrategies.map((strategy) => async () => {
     const startTime = Date.now();
     try {
-      const result = await withCircuitBreaker(strategy.name, () => strategy.fn());
+      const result = await withCircuitBreaker(strategy.name, () => strategy.fn(title));
       const durationMs = Date.now() - startTime;
       const status = result.success && result.pdf_url ? 'found' : 'not_found';
       logSourceTiming(log, strategy.name, durationMs, status);
@@ -236,8 +275,12 @@ async function fetchPaperInternal(title, options = {}) {
     }
   });
 
-  // Run with concurrency limit
-  const results = await runWithConcurrencyLimit(tasks, CONCURRENCY_CONFIG.maxConcurrent);
+  // Run with concurrency limit, stopping once the best available PDF is known
+  const results = await runUntilBestResult(
+    tasks,
+    CONCURRENCY_CONFIG.maxConcurrent,
+    ({ result }) => result.success && result.pdf_url
+  );
 
   // Process results: find PDFs, collect DOIs and metadata
   const successfulResults = [];
@@ -252,8 +295,9 @@ async function fetchPaperInternal(title, options = {}) {
         log.info({ source: name }, 'Found PDF');
         successfulResults.push({ name, result });
       } else {
-        if (result.doi) {
-          collectedDois.push(result.doi);
+        const doi = normalizeDoi(result.doi);
+        if (doi) {
+          collectedDois.push(doi);
         }
         // Collect metadata even from unsuccessful results
         if (result.metadata) {
@@ -296,7 +340,7 @@ async function fetchPaperInternal(title, options = {}) {
     };
 
     // Cache the result
-    await cacheSet(title, finalResult);
+    await cacheSet(normalizedKey, finalResult, { normalized: true });
 
     return finalResult;
   }
@@ -329,7 +373,7 @@ async function fetchPaperInternal(title, options = {}) {
           fetchedAt: new Date().toISOString()
         };
 
-        await cacheSet(title, finalResult);
+        await cacheSet(normalizedKey, finalResult, { normalized: true });
 
         return finalResult;
       }
@@ -350,12 +394,12 @@ async function fetchPaperInternal(title, options = {}) {
     doi: collectedDois[0] || null,
     // Include best metadata from sources
     metadata: collectedMetadata[0] || null,
-    triedSources: strategies.map(s => s.name).concat(collectedDois.length > 0 ? ['Unpaywall'] : []),
+    triedSources: STRATEGY_NAMES.concat(collectedDois.length > 0 ? ['Unpaywall'] : []),
     fetchedAt: new Date().toISOString()
   };
 
   // Cache the failed result (negative caching) to avoid repeated searches
-  await cacheSetNegative(title, failedResult);
+  await cacheSetNegative(normalizedKey, failedResult, { normalized: true });
 
   return failedResult;
 }
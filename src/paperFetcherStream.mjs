@@ -6,7 +6,8 @@ import { fetchFromCore } from './fetchers/core.mjs';
 import { fetchFromOpenAlex } from './fetchers/openalex.mjs';
 import { fetchFromPubMed } from './fetchers/pubmed.mjs';
 import { fetchFromWebSearch } from './fetchers/webSearch.mjs';
-import { cacheGet, cacheSet } from './cache.mjs';
+import { cacheLookup, cacheSet, cacheSetNegative } from './cache.mjs';
+import { normalizeDoi } from './utils/doi.mjs';
 
 /**
  * Source priority for selecting best result
@@ -22,6 +23,19 @@ const SOURCE_PRIORITY = {
   'Unpaywall': 8
 };
 
+/**
+ * Fetching strategies, built once at load time rather than per request
+ */
+const STRATEGIES = Object.freeze([
+  { name: 'arXiv', fn: fetchFromArxiv },
+  { name: 'Semantic Scholar', fn: fetchFromSemanticScholar },
+  { name: 'OpenAlex', fn: fetchFromOpenAlex },
+  { name: 'PubMed Central', fn: fetchFromPubMed },
+  { name: 'CORE', fn: fetchFromCore },
+  { name: 'Crossref', fn: fetchFromCrossref },
+  { name: 'Web Search', fn: fetchFromWebSearch },
+]);
+
 /**
  * Streaming paper fetcher with progress events
  * Emits events as each source is tried
@@ -31,39 +45,36 @@ const SOURCE_PRIORITY = {
  * @param {object} options - Fetch options
  */
 export async function fetchPaperWithProgress(title, emit, options = {}) {
-  // Check cache first
+  // Check cache first, including previously failed lookups
   if (!options.skipCache) {
-    const cached = await cacheGet(title);
+    const { entry, negative } = await cacheLookup(title);
+    // The JSON file backend keeps failed lookups under the paper key itself
+    const negativeCached = entry?.isNegativeCache ? entry : negative;
+    const cached = entry?.isNegativeCache ? null : entry;
     if (cached) {
       emit('cache_hit', { title });
-      emit('complete', { ...cached, cached: true });
+      emit('complete', cached);
+      return;
+    }
+    if (negativeCached && !negativeCached.expired) {
+      emit('cache_hit', { title, negative: true });
+      emit('complete', negativeCached);
       return;
     }
   }
 
-  emit('start', { title, sources: 7 });
-
-  // Define fetching strategies
-  const strategies = [
-    { name: 'arXiv', fn: () => fetchFromArxiv(title) },
-    { name: 'Semantic Scholar', fn: () => fetchFromSemanticScholar(title) },
-    { name: 'OpenAlex', fn: () => fetchFromOpenAlex(title) },
-    { name: 'PubMed Central', fn: () => fetchFromPubMed(title) },
-    { name: 'CORE', fn: () => fetchFromCore(title) },
-    { name: 'Crossref', fn: () => fetchFromCrossref(title) },
-    { name: 'Web Search', fn: () => fetchFromWebSearch(title) },
-  ];
+  emit('start', { title, sources: STRATEGIES.length });
 
   const successfulResults = [];
   const collectedDois = [];
   const collectedMetadata = [];
 
   // Run strategies with progress events
-  const promises = strategies.map(async (strategy) => {
+  const promises = STRATEGIES.map(async (strategy) => {
     emit('trying', { source: strategy.name });
 
     try {
-      const result = await strategy.fn();
+      const result = await strategy.fn(title);
 
       if (result.success && result.pdf_url) {
         emit('found', { source: strategy.name, pdf_url: result.pdf_url });
@@ -91,7 +102,8 @@ export async function fetchPaperWithProgress(title, emit, options = {}) {
       if (success) {
         successfulResults.push({ name, result });
       } else {
-        if (result.doi) collectedDois.push(result.doi);
+        const doi = normalizeDoi(result.doi);
+        if (doi) collectedDois.push(doi);
         if (result.metadata) collectedMetadata.push({ source: name, ...result.metadata });
       }
     }
@@ -157,12 +169,16 @@ export async function fetchPaperWithProgress(title, emit, options = {}) {
 
   // All failed
   const hasPartialData = collectedDois.length > 0 || collectedMetadata.length > 0;
-  emit('complete', {
+  const failedResult = {
     success: false,
     partial: hasPartialData,
     error: 'No open access PDF found',
     doi: collectedDois[0] || null,
     metadata: collectedMetadata[0] || null,
     fetchedAt: new Date().toISOString()
-  });
+  };
+
+  // Negative cache so repeated lookups skip the sources entirely
+  await cacheSetNegative(title, failedResult);
+  emit('complete', failedResult);
 }
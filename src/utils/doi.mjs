@@ -0,0 +1,34 @@
+/**
+ * DOI normalization helpers
+ */
+
+// Resolver prefixes sources and users put in front of bare DOIs (lowercase)
+const DOI_PREFIXES = [
+  'https://doi.org/',
+  'http://doi.org/',
+  'https://dx.doi.org/',
+  'http://dx.doi.org/',
+  'dx.doi.org/',
+  'doi.org/',
+  'doi:'
+];
+
+/**
+ * Normalize a DOI to its bare, lowercase form (10.xxxx/...)
+ * DOIs are case-insensitive, so lowercasing is safe and makes prefix
+ * stripping a single startsWith check per prefix
+ * @param {string} doi - DOI, optionally as a resolver URL
+ * @returns {string|null} Bare DOI, or null if empty
+ */
+export function normalizeDoi(doi) {
+  if (!doi) return null;
+
+  const normalized = doi.trim().toLowerCase();
+  for (const prefix of DOI_PREFIXES) {
+    if (normalized.startsWith(prefix)) {
+      // Prefixes like "doi: 10.xxxx/..." may be followed by whitespace
+      return normalized.slice(prefix.length).trim() || null;
+    }
+  }
+  return normalized || null;
+}
@@ -1,3 +1,12 @@
+const PUNCTUATION = /[^\w\s]/g;
+const WHITESPACE = /\s+/g;
+
+// Memoized token sets - the same search title is compared
+// against every result from every source
+const TOKEN_CACHE_SIZE = 4096;
+const titleTokenSets = new Map();
+const EMPTY_TOKENS = new Set();
+
 /**
  * Normalize a title for comparison
  */
@@ -5,35 +14,83 @@ function normalizeTitle(title) {
   if (!title) return '';
   return title
     .toLowerCase()
-    .replace(/[^\w\s]/g, ' ')
-    .replace(/\s+/g, ' ')
+    .replace(PUNCTUATION, ' ')
+    .replace(WHITESPACE, ' ')
     .trim();
 }
 
+/**
+ * Get the set of significant words (longer than 2 chars) in a title
+ * Results are memoized and must not be mutated
+ */
+function titleTokens(title) {
+  if (!title) return EMPTY_TOKENS;
+
+  let tokens = titleTokenSets.get(title);
+  if (tokens !== undefined) return tokens;
+
+  const normalized = normalizeTitle(title);
+  tokens = normalized
+    ? new Set(normalized.split(' ').filter(w => w.length > 2))
+    : EMPTY_TOKENS;
+
+  // Evict oldest entry (Map preserves insertion order)
+  if (titleTokenSets.size >= TOKEN_CACHE_SIZE) {
+    titleTokenSets.delete(titleTokenSets.keys().next().value);
+  }
+  titleTokenSets.set(title, tokens);
+  return tokens;
+}
+
 /**
  * Calculate word overlap similarity between two titles
  * Returns a score between 0 and 1
  */
 export function titleSimilarity(title1, title2) {
-  const norm1 = normalizeTitle(title1);
-  const norm2 = normalizeTitle(title2);
-  
-  if (!norm1 || !norm2) return 0;
-  
-  const words1 = new Set(norm1.split(' ').filter(w => w.length > 2));
-  const words2 = new Set(norm2.split(' ').filter(w => w.length > 2));
-  
+  const words1 = titleTokens(title1);
+  const words2 = titleTokens(title2);
+
   if (words1.size === 0 || words2.size === 0) return 0;
-  
-  const intersection = [...words1].filter(w => words2.has(w)).length;
-  const union = new Set([...words1, ...words2]).size;
-  
-  return intersection / union;
+
+  const [smaller, larger] = words1.size <= words2.size ? [words1, words2] : [words2, words1];
+  let intersection = 0;
+  for (const word of smaller) {
+    if (larger.has(word)) intersection++;
+  }
+
+  // |A ∪ B| = |A| + |B| - |A ∩ B|, no need to build the union set
+  return intersection / (words1.size + words2.size - intersection);
 }
 
 /**
  * Check if result title matches search title (50% word overlap threshold)
+ * Stops counting as soon as the outcome is decided. Similarity only grows
+ * with the intersection, so every check uses the same division as
+ * titleSimilarity and the decision is identical to comparing its score
  */
 export function isTitleMatch(searchTitle, resultTitle, threshold = 0.5) {
-  return titleSimilarity(searchTitle, resultTitle) >= threshold;
+  const words1 = titleTokens(searchTitle);
+  const words2 = titleTokens(resultTitle);
+
+  if (words1.size === 0 || words2.size === 0) return 0 >= threshold;
+
+  const [smaller, larger] = words1.size <= words2.size ? [words1, words2] : [words2, words1];
+  const total = words1.size + words2.size;
+  let intersection = 0;
+  let remaining = smaller.size;
+
+  for (const word of smaller) {
+    remaining--;
+    if (larger.has(word)) {
+      intersection++;
+      // Already at the threshold - more matches can only raise the score
+      if (intersection / (total - intersection) >= threshold) return true;
+    } else {
+      // Can't reach the threshold even if every remaining word matches
+      const best = intersection + remaining;
+      if (best / (total - best) < threshold) return false;
+    }
+  }
+
+  return intersection / (total - intersection) >= threshold;
 }
@@ -0,0 +1,116 @@
+import { test, after } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { pathToFileURL } from 'url';
+
+/**
+ * JSON file cache tests
+ * Covers the batched write queue: read-your-writes, explicit flushes,
+ * failed flushes and the expired entry sweep
+ * Run with: npm run test:unit
+ */
+
+const DAY = 24 * 60 * 60 * 1000;
+
+// Load cache.mjs from a temp dir next to a silent logger, with a temp cache file
+const dir = await fs.mkdtemp(path.join(os.tmpdir(), 'icanhazpdf-cache-'));
+await fs.copyFile(new URL('../src/cache.mjs', import.meta.url), path.join(dir, 'cache.mjs'));
+await fs.writeFile(path.join(dir, 'logger.mjs'), 'export default { info() {}, warn() {}, error() {} };\n');
+
+const CACHE_FILE = path.join(dir, 'cache.json');
+process.env.CACHE_FILE = CACHE_FILE;
+delete process.env.KV_REST_API_URL;
+delete process.env.KV_REST_API_TOKEN;
+
+const cache = await import(pathToFileURL(path.join(dir, 'cache.mjs')).href);
+
+// Only flush when a test asks for it
+cache.CACHE_CONFIG.writeFlushMs = 60 * 1000;
+
+after(async () => {
+  await cache.flushCache();
+  await fs.rm(dir, { recursive: true, force: true });
+});
+
+async function readCacheFile() {
+  return JSON.parse(await fs.readFile(CACHE_FILE, 'utf-8'));
+}
+
+test('reads see queued writes before they are flushed', async () => {
+  await cache.cacheSet('Attention Is  All You Need', { success: true, pdf_url: 'https://example.org/a.pdf' });
+
+  await assert.rejects(fs.access(CACHE_FILE), 'nothing should be on disk yet');
+
+  const entry = await cache.cacheGet('attention is all you need');
+  assert.equal(entry.pdf_url, 'https://example.org/a.pdf');
+  assert.equal(entry.cached, true);
+
+  const { entry: looked } = await cache.cacheLookup('Attention is all you need');
+  assert.equal(looked.pdf_url, 'https://example.org/a.pdf');
+
+  await cache.flushCache();
+});
+
+test('flushCache persists the pending batch', async () => {
+  await cache.cacheSet('Paper One', { success: true, pdf_url: 'https://example.org/1.pdf' });
+  await cache.cacheSetNegative('Paper Two', { success: false, error: 'No open access PDF found' });
+
+  assert.equal(await cache.flushCache(), true);
+
+  const onDisk = await readCacheFile();
+  assert.equal(onDisk['paper one'].pdf_url, 'https://example.org/1.pdf');
+  assert.equal(onDisk['paper two'].isNegativeCache, true);
+  assert.ok(onDisk['paper one'].cachedAt);
+});
+
+test('a queued delete hides the entry before and after the flush', async () => {
+  await cache.cacheSet('Doomed Paper', { success: true, pdf_url: 'https://example.org/d.pdf' });
+  await cache.flushCache();
+  assert.ok(await cache.cacheGet('Doomed Paper'));
+
+  const deleted = cache.cacheDelete('Doomed Paper');
+  assert.equal(await cache.cacheGet('Doomed Paper'), null);
+
+  await cache.flushCache();
+  assert.equal(await deleted, true);
+  assert.equal(await cache.cacheGet('Doomed Paper'), null);
+  assert.equal('doomed paper' in await readCacheFile(), false);
+});
+
+test('a failed flush drops the in-memory copy of the file', async (t) => {
+  await cache.cacheSet('Kept Paper', { success: true, pdf_url: 'https://example.org/k.pdf' });
+  await cache.flushCache();
+
+  // The failed batch is applied to the parsed file in memory before the write
+  t.mock.method(fs, 'rename', async () => { throw new Error('disk full'); });
+  await cache.cacheSet('Lost Paper', { success: true, pdf_url: 'https://example.org/l.pdf' });
+  assert.equal(await cache.flushCache(), false);
+  t.mock.restoreAll();
+
+  assert.equal(await cache.cacheGet('Lost Paper'), null, 'unpersisted entry must not be served');
+  assert.equal((await cache.cacheGet('Kept Paper')).pdf_url, 'https://example.org/k.pdf');
+
+  const leftovers = (await fs.readdir(dir)).filter(name => name.endsWith('.tmp'));
+  assert.deepEqual(leftovers, []);
+});
+
+test('the periodic sweep removes only expired entries', async (t) => {
+  const ago = ms => new Date(Date.now() - ms).toISOString();
+  await fs.writeFile(CACHE_FILE, JSON.stringify({
+    'fresh hit': { success: true, cachedAt: ago(DAY) },
+    'old hit': { success: true, cachedAt: ago(8 * DAY) },
+    'fresh miss': { success: false, isNegativeCache: true, cachedAt: ago(DAY / 2) },
+    'old miss': { success: false, isNegativeCache: true, cachedAt: ago(2 * DAY) }
+  }));
+
+  const { purgeInterval } = cache.CACHE_CONFIG;
+  cache.CACHE_CONFIG.purgeInterval = 0;
+  t.after(() => { cache.CACHE_CONFIG.purgeInterval = purgeInterval; });
+
+  await cache.cacheSet('New Paper', { success: true });
+  assert.equal(await cache.flushCache(), true);
+
+  assert.deepEqual(Object.keys(await readCacheFile()).sort(), ['fresh hit', 'fresh miss', 'new paper']);
+});
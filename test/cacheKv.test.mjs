@@ -0,0 +1,135 @@
+import { test, beforeEach, after } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { pathToFileURL } from 'url';
+
+/**
+ * Vercel KV cache tests
+ * Checks that cacheLookup serves the in-process L1 first and otherwise
+ * resolves both the paper and negative keys in one MGET
+ * Run with: npm run test:unit
+ */
+
+// In-memory stand-in for @vercel/kv that records every call
+const store = new Map();
+const calls = [];
+globalThis.mockKv = {
+  async get(key) {
+    calls.push(['get', key]);
+    return store.get(key) ?? null;
+  },
+  async mget(...keys) {
+    calls.push(['mget', ...keys]);
+    return keys.map(key => store.get(key) ?? null);
+  },
+  async set(key, value) {
+    calls.push(['set', key]);
+    store.set(key, value);
+    return 'OK';
+  },
+  async del(key) {
+    calls.push(['del', key]);
+    return store.delete(key) ? 1 : 0;
+  }
+};
+
+// Load cache.mjs from a temp dir next to a silent logger and the mock KV package
+const dir = await fs.mkdtemp(path.join(os.tmpdir(), 'icanhazpdf-kv-'));
+const kvDir = path.join(dir, 'node_modules', '@vercel', 'kv');
+await fs.mkdir(kvDir, { recursive: true });
+await fs.writeFile(path.join(kvDir, 'package.json'), '{ "type": "module", "main": "index.js" }\n');
+await fs.writeFile(path.join(kvDir, 'index.js'), 'export const kv = globalThis.mockKv;\n');
+await fs.copyFile(new URL('../src/cache.mjs', import.meta.url), path.join(dir, 'cache.mjs'));
+await fs.writeFile(path.join(dir, 'logger.mjs'), 'export default { info() {}, warn() {}, error() {} };\n');
+
+process.env.CACHE_FILE = path.join(dir, 'cache.json');
+process.env.KV_REST_API_URL = 'https://kv.example.invalid';
+process.env.KV_REST_API_TOKEN = 'test-token';
+
+const cache = await import(pathToFileURL(path.join(dir, 'cache.mjs')).href);
+
+beforeEach(() => {
+  calls.length = 0;
+});
+
+after(async () => {
+  await fs.rm(dir, { recursive: true, force: true });
+});
+
+const now = () => new Date().toISOString();
+
+test('uses the KV backend', async () => {
+  assert.equal(await cache.isUsingKV(), true);
+});
+
+test('a cold lookup costs one MGET and fills the L1', async () => {
+  store.set('paper:cold paper', { success: true, pdf_url: 'https://example.org/c.pdf', cachedAt: now() });
+
+  const { entry, negative } = await cache.cacheLookup('Cold Paper');
+  assert.equal(entry.pdf_url, 'https://example.org/c.pdf');
+  assert.equal(entry.cached, true);
+  assert.equal(negative, null);
+  assert.deepEqual(calls, [['mget', 'paper:cold paper', 'negative:cold paper']]);
+
+  // Served from the L1 even after KV changes
+  calls.length = 0;
+  store.set('paper:cold paper', { success: true, pdf_url: 'https://example.org/changed.pdf', cachedAt: now() });
+  const again = await cache.cacheLookup('Cold Paper');
+  assert.equal(again.entry.pdf_url, 'https://example.org/c.pdf');
+  assert.deepEqual(calls, []);
+});
+
+test('a positive L1 hit skips KV', async () => {
+  await cache.cacheSet('Fresh Paper', { success: true, pdf_url: 'https://example.org/f.pdf' });
+  assert.deepEqual(calls, [['set', 'paper:fresh paper']]);
+
+  calls.length = 0;
+  const { entry } = await cache.cacheLookup('fresh  paper');
+  assert.equal(entry.pdf_url, 'https://example.org/f.pdf');
+  assert.deepEqual(calls, []);
+});
+
+test('a cold negative lookup fills the L1 and later hits skip KV', async () => {
+  store.set('negative:missing paper', { success: false, isNegativeCache: true, cachedAt: now() });
+
+  const first = await cache.cacheLookup('Missing Paper');
+  assert.equal(first.entry, null);
+  assert.equal(first.negative.isNegativeCache, true);
+  assert.equal(first.negative.cached, true);
+  assert.equal(calls.length, 1);
+  assert.equal(calls[0][0], 'mget');
+
+  calls.length = 0;
+  const second = await cache.cacheLookup('Missing Paper');
+  assert.equal(second.entry, null);
+  assert.equal(second.negative.isNegativeCache, true);
+  assert.deepEqual(calls, []);
+});
+
+test('a stored negative result is served from the L1', async () => {
+  await cache.cacheSetNegative('Unfindable Paper', { error: 'No open access PDF found' });
+
+  calls.length = 0;
+  const { entry, negative } = await cache.cacheLookup('Unfindable Paper');
+  assert.equal(entry, null);
+  assert.equal(negative.error, 'No open access PDF found');
+  assert.deepEqual(calls, []);
+});
+
+test('a complete miss is not cached in the L1', async () => {
+  await cache.cacheLookup('Unknown Paper');
+  await cache.cacheLookup('Unknown Paper');
+  assert.deepEqual(calls.map(([method]) => method), ['mget', 'mget']);
+});
+
+test('cacheDelete evicts the L1 entry', async () => {
+  await cache.cacheSet('Retracted Paper', { success: true });
+  await cache.cacheDelete('Retracted Paper');
+
+  calls.length = 0;
+  const { entry } = await cache.cacheLookup('Retracted Paper');
+  assert.equal(entry, null);
+  assert.deepEqual(calls.map(([method]) => method), ['mget']);
+});
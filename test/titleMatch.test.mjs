@@ -0,0 +1,91 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { titleSimilarity, isTitleMatch } from '../src/utils/titleMatch.mjs';
+
+/**
+ * Title matching tests
+ * Checks the optimized implementation against the original one
+ * Run with: npm run test:unit
+ */
+
+// Original implementation, kept as the reference
+function referenceNormalize(title) {
+  if (!title) return '';
+  return title
+    .toLowerCase()
+    .replace(/[^\w\s]/g, ' ')
+    .replace(/\s+/g, ' ')
+    .trim();
+}
+
+function referenceSimilarity(title1, title2) {
+  const norm1 = referenceNormalize(title1);
+  const norm2 = referenceNormalize(title2);
+
+  if (!norm1 || !norm2) return 0;
+
+  const words1 = new Set(norm1.split(' ').filter(w => w.length > 2));
+  const words2 = new Set(norm2.split(' ').filter(w => w.length > 2));
+
+  if (words1.size === 0 || words2.size === 0) return 0;
+
+  const intersection = [...words1].filter(w => words2.has(w)).length;
+  const union = new Set([...words1, ...words2]).size;
+
+  return intersection / union;
+}
+
+// Seeded PRNG (mulberry32) so every run checks the same pairs
+function createRandom(seed) {
+  return () => {
+    seed = (seed + 0x6D2B79F5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const VOCABULARY = [
+  'the', 'of', 'all', 'you', 'need', 'attention', 'deep', 'learning', 'neural',
+  'network', 'residual', 'image', 'graph', 'model', 'language', 'transformer',
+  'bert', 'gan', 'for', 'with', 'Pre-training', 'ImageNet', 'classification'
+];
+const THRESHOLDS = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1];
+
+function randomTitle(random) {
+  if (random() < 0.03) return random() < 0.5 ? '' : null;
+  const length = 1 + Math.floor(random() * 10);
+  const separator = random() < 0.5 ? ' ' : ', ';
+  return Array.from({ length }, () => VOCABULARY[Math.floor(random() * VOCABULARY.length)]).join(separator);
+}
+
+test('titleSimilarity matches the reference implementation', () => {
+  const random = createRandom(1);
+  for (let i = 0; i < 50000; i++) {
+    const a = randomTitle(random);
+    const b = randomTitle(random);
+    assert.equal(titleSimilarity(a, b), referenceSimilarity(a, b), `${a} | ${b}`);
+  }
+});
+
+test('isTitleMatch decisions match the reference implementation', () => {
+  const random = createRandom(2);
+  for (let i = 0; i < 50000; i++) {
+    const a = randomTitle(random);
+    const b = randomTitle(random);
+    const threshold = THRESHOLDS[i % THRESHOLDS.length];
+    assert.equal(
+      isTitleMatch(a, b, threshold),
+      referenceSimilarity(a, b) >= threshold,
+      `${a} | ${b} @ ${threshold}`
+    );
+  }
+});
+
+test('isTitleMatch handles scores exactly at the threshold', () => {
+  // 1 / 5 = 0.2, but 1 * 1.2 >= 0.2 * 6 is false in floating point
+  assert.equal(isTitleMatch('model learning graph all all all of', 'bert all', 0.2), true);
+  assert.equal(isTitleMatch('Attention Is All You Need', 'attention is all you need'), true);
+  assert.equal(isTitleMatch('Deep Residual Learning', 'Graph Neural Networks'), false);
+  assert.equal(isTitleMatch('', 'anything', 0), true);
+});